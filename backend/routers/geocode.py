@@ -1,36 +1,45 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException
+from starlette.concurrency import run_in_threadpool
 
 from backend.models.requests import SingleLocationRequest, BatchLocationRequest
-from backend.models.responses import SingleLocationResponse, BatchLocationResponse, LocationResult
+from backend.models.responses import SingleLocationResponse, BatchLocationResponse
+from backend.services import get_geocoding_service
 from backend.services.geocoding_service import GeocodingService
 
 router = APIRouter()
-geocoding_service = GeocodingService()
 
 @router.post("/geocode/single", response_model=SingleLocationResponse)
-async def geocode_single_location(request: SingleLocationRequest):
+async def geocode_single_location(
+    request: SingleLocationRequest,
+    service: GeocodingService = Depends(get_geocoding_service),
+):
     """Geocode a single location and return coordinates + all ABS classifications."""
     try:
-        result = geocoding_service.process_single_location(request.location)
-        return SingleLocationResponse(result=result)
+        # Offload blocking Nominatim + sjoin work so the event loop stays responsive
+        result = await run_in_threadpool(service.process_single_location, request.location)
+        # model_construct skips re-validating the service-built result
+        return SingleLocationResponse.model_construct(result=result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 @router.post("/geocode/batch", response_model=BatchLocationResponse)
-async def geocode_batch_locations(request: BatchLocationRequest):
+async def geocode_batch_locations(
+    request: BatchLocationRequest,
+    service: GeocodingService = Depends(get_geocoding_service),
+):
     """Geocode multiple locations and return coordinates + all ABS classifications."""
     try:
-        results = geocoding_service.process_batch_locations(request.locations)
-        
+        # The service geocodes concurrently and classifies all points in one pass
+        results = await run_in_threadpool(service.process_batch_locations, request.locations)
+
         successful_geocodes = sum(1 for result in results if result.geocode_success)
         failed_geocodes = len(results) - successful_geocodes
-        
-        return BatchLocationResponse(
+
+        return BatchLocationResponse.model_construct(
             results=results,
             total_processed=len(results),
             successful_geocodes=successful_geocodes,
             failed_geocodes=failed_geocodes
         )
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -0,0 +1,18 @@
+from typing import Optional
+
+from backend.services.geocoding_service import GeocodingService
+
+# Single shared service instance - the SA1 boundary cache it warms is large,
+# so every router must reuse the same object. Built lazily on first use: a
+# module-level GeocodingService() would shadow the geocoding_service submodule
+# attribute on this package (breaking attribute imports and mock.patch
+# targets) and make the SA1 preload an import side effect.
+_service: Optional[GeocodingService] = None
+
+
+def get_geocoding_service() -> GeocodingService:
+    """FastAPI dependency returning the shared GeocodingService."""
+    global _service
+    if _service is None:
+        _service = GeocodingService()
+    return _service
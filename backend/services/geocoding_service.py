@@ -1,80 +1,107 @@
 import logging
-from typing import List, Dict, Any
-import pandas as pd
-from shapely.geometry import Point
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 
 from src.geocode import geocode_name
-from src.classify import classify_points
 from backend.models.responses import LocationResult
 
+# pandas and src.classify (which pulls in geopandas/shapely) are imported
+# lazily inside methods - they dominate cold-start time, and deferring them
+# keeps importing this module cheap (tests, tooling). The heavy load happens
+# when the service is first constructed by get_geocoding_service(), or
+# earlier via the app lifespan's warm_sa1_cache, never at import time.
+
 logger = logging.getLogger(__name__)
 
+# Bound on concurrent Nominatim calls when geocoding a batch
+MAX_GEOCODE_WORKERS = 8
+
+# How long a health snapshot stays valid before it is recomputed
+HEALTH_CACHE_TTL_SEC = 30.0
+
+
+def _normalize_location(location: str) -> str:
+    """Normalize a location string into a stable geocode cache key."""
+    return re.sub(r"\s+", " ", location.strip().lower())
+
+
+# Manual memo rather than lru_cache: only successes are stored, so a transient
+# Nominatim outage doesn't pin (None, None, None) for a name for the life of
+# the process - failed names retry on the next request, and the disk cache's
+# short negative TTL still absorbs repeated known-bad lookups
+_geocode_memo: Dict[str, Tuple[float, float, Optional[str]]] = {}
+
+
+def _cached_geocode(norm_name: str) -> Tuple[Optional[float], Optional[float], Optional[str]]:
+    """Geocode a normalized location string, memoizing successful results.
+
+    Repeated CHC names each pay a full Nominatim round trip plus the rate-limit
+    delay; the memo makes duplicates free across requests.
+    """
+    cached = _geocode_memo.get(norm_name)
+    if cached is not None:
+        return cached
+    result = geocode_name(norm_name)
+    coords = (result['lat'], result['lon'], result['address'])
+    if coords[0] is not None and coords[1] is not None:
+        _geocode_memo[norm_name] = coords
+    return coords
+
 class GeocodingService:
     """Service layer for geocoding and classification operations."""
-    
+
     def __init__(self):
         self.logger = logger
+        self._health_cache: Optional[Dict[str, Any]] = None
+        self._health_ts = 0.0
+        # Preload the SA1 boundary cache so the first request isn't penalized
+        from src.classify import warm_sa1_cache
+
+        if warm_sa1_cache():
+            logger.info("SA1 boundary cache preloaded")
     
     def process_single_location(self, location: str) -> LocationResult:
         """Process a single location and return all classifications."""
         try:
-            # Geocode the location
-            geocode_result = geocode_name(location)
-            
-            if geocode_result['lat'] is None or geocode_result['lon'] is None:
+            import pandas as pd
+
+            from src.classify import classify_points
+
+            # Geocode the location (memoized across requests)
+            lat, lon, address = _cached_geocode(_normalize_location(location))
+
+            if lat is None or lon is None:
                 return LocationResult(
                     location=location,
                     geocode_success=False,
                     error_message="Geocoding failed - location not found"
                 )
-            
+
             # Create DataFrame for classification
             df = pd.DataFrame([{
                 'CHC': location,
-                'Latitude': geocode_result['lat'],
-                'Longitude': geocode_result['lon'],
-                'Address': geocode_result['address']
+                'Latitude': lat,
+                'Longitude': lon,
+                'Address': address
             }])
-            
+
             # Classify the point
             classified_df = classify_points(df)
-            
+
             if classified_df.empty:
                 return LocationResult(
                     location=location,
-                    latitude=geocode_result['lat'],
-                    longitude=geocode_result['lon'],
+                    latitude=lat,
+                    longitude=lon,
                     geocode_success=True,
                     error_message="Classification failed - no ASGS data available"
                 )
             
             # Extract the result
-            row = classified_df.iloc[0]
-            
-            return LocationResult(
-                location=location,
-                latitude=row.get('Latitude'),
-                longitude=row.get('Longitude'),
-                address=row.get('Address'),
-                sa1_code=row.get('SA1'),
-                sa1_name=None,  # Not available in current ASGS data structure
-                sa2_code=row.get('SA2_CODE'),
-                sa2_name=row.get('SA2_NAME'),
-                sa3_code=row.get('SA3_CODE'),
-                sa3_name=row.get('SA3_NAME'),
-                sa4_code=row.get('SA4_CODE'),
-                sa4_name=row.get('SA4_NAME'),
-                gccsa_code=row.get('GCCSA_CODE'),
-                gccsa_name=row.get('GCCSA_NAME'),
-                state_code=row.get('STATE_CODE'),
-                state_name=row.get('STATE_NAME'),
-                iare_code=row.get('IARE_CODE'),
-                iare_name=row.get('IARE_NAME'),
-                ireg_code=row.get('IREG_CODE'),
-                ireg_name=row.get('IREG_NAME'),
-                geocode_success=True
-            )
-            
+            return self._row_to_result(location, classified_df.to_dict(orient='records')[0])
+
         except Exception as e:
             logger.error(f"Error processing location '{location}': {str(e)}")
             return LocationResult(
@@ -82,43 +109,127 @@ class GeocodingService:
                 geocode_success=False,
                 error_message=f"Processing error: {str(e)}"
             )
-    
+
     def process_batch_locations(self, locations: List[str]) -> List[LocationResult]:
-        """Process multiple locations and return all classifications."""
-        results = []
-        
-        for location in locations:
-            result = self.process_single_location(location)
-            results.append(result)
-            
-        return results
+        """Process multiple locations with one batched classification pass."""
+        if not locations:
+            return []
+
+        try:
+            import pandas as pd
+
+            from src.classify import classify_points
+
+            # Geocode concurrently - Nominatim RTT dominates, so overlap the calls
+            # (memoized, so duplicate names across batches are free)
+            with ThreadPoolExecutor(max_workers=MAX_GEOCODE_WORKERS) as executor:
+                geocode_results = list(
+                    executor.map(_cached_geocode, (_normalize_location(loc) for loc in locations))
+                )
+
+            # Build one DataFrame and classify all points in a single pass
+            df = pd.DataFrame({
+                'CHC': locations,
+                'Latitude': [lat for lat, _, _ in geocode_results],
+                'Longitude': [lon for _, lon, _ in geocode_results],
+                'Address': [address for _, _, address in geocode_results]
+            })
+            classified_df = classify_points(df)
+
+            # One C-level pass to plain dicts instead of N .iloc row lookups
+            records = classified_df.to_dict(orient='records')
+
+            results = []
+            for location, (lat, lon, _), record in zip(locations, geocode_results, records):
+                if lat is None or lon is None:
+                    results.append(LocationResult(
+                        location=location,
+                        geocode_success=False,
+                        error_message="Geocoding failed - location not found"
+                    ))
+                else:
+                    results.append(self._row_to_result(location, record))
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Error processing batch of {len(locations)} locations: {str(e)}")
+            return [
+                LocationResult(
+                    location=location,
+                    geocode_success=False,
+                    error_message=f"Processing error: {str(e)}"
+                )
+                for location in locations
+            ]
+
+    def _row_to_result(self, location: str, row: Dict[str, Any]) -> LocationResult:
+        """Convert a classified row record into a LocationResult.
+
+        Uses model_construct: the fields come from our own classification
+        output, so re-validating ~20 optional fields per row is wasted work.
+        """
+        return LocationResult.model_construct(
+            location=location,
+            latitude=row.get('Latitude'),
+            longitude=row.get('Longitude'),
+            address=row.get('Address'),
+            sa1_code=row.get('SA1'),
+            sa1_name=None,  # Not available in current ASGS data structure
+            sa2_code=row.get('SA2_CODE'),
+            sa2_name=row.get('SA2_NAME'),
+            sa3_code=row.get('SA3_CODE'),
+            sa3_name=row.get('SA3_NAME'),
+            sa4_code=row.get('SA4_CODE'),
+            sa4_name=row.get('SA4_NAME'),
+            gccsa_code=row.get('GCCSA_CODE'),
+            gccsa_name=row.get('GCCSA_NAME'),
+            state_code=row.get('STATE_CODE'),
+            state_name=row.get('STATE_NAME'),
+            iare_code=row.get('IARE_CODE'),
+            iare_name=row.get('IARE_NAME'),
+            ireg_code=row.get('IREG_CODE'),
+            ireg_name=row.get('IREG_NAME'),
+            geocode_success=True
+        )
     
     def check_system_health(self) -> Dict[str, Any]:
-        """Check if system components are available."""
+        """Check if system components are available.
+
+        The snapshot is cached for HEALTH_CACHE_TTL_SEC so frequent monitoring
+        probes stay sub-millisecond and don't hammer Nominatim.
+        """
+        if (
+            self._health_cache is not None
+            and time.monotonic() - self._health_ts < HEALTH_CACHE_TTL_SEC
+        ):
+            return self._health_cache
+
         try:
             # Test geocoding
             test_result = geocode_name("Alice Springs, NT")
             nominatim_accessible = test_result.get('lat') is not None
-            
-            # Test ASGS files (this will be checked in classify module)
-            test_df = pd.DataFrame([{'location': 'test', 'Latitude': -23.0, 'Longitude': 133.0}])
-            try:
-                classified_df = classify_points(test_df)
-                asgs_files_available = not classified_df.empty
-            except Exception:
-                asgs_files_available = False
-            
-            return {
+
+            # The file stat is authoritative - no need to run a classification
+            from src.settings import get_settings
+            sa1_path = get_settings().asgs_sa1_path
+            asgs_files_available = sa1_path is not None and sa1_path.exists()
+
+            health = {
                 'status': 'healthy' if nominatim_accessible and asgs_files_available else 'degraded',
                 'nominatim_accessible': nominatim_accessible,
                 'asgs_files_available': asgs_files_available
             }
-            
+
         except Exception as e:
             logger.error(f"Health check failed: {str(e)}")
-            return {
+            health = {
                 'status': 'unhealthy',
                 'nominatim_accessible': False,
                 'asgs_files_available': False,
                 'error': str(e)
-            }
\ No newline at end of file
+            }
+
+        self._health_cache = health
+        self._health_ts = time.monotonic()
+        return health
\ No newline at end of file
@@ -272,6 +272,38 @@ def main(
         main_process(input_csv, output_csv, skip_classification, create_sample, rebuild)
 
 
+@app.command("convert-asgs")
+def convert_asgs() -> None:
+    """Convert configured ASGS boundary files to GeoParquet for faster loading."""
+    import geopandas as gpd
+
+    settings = get_settings()
+    asgs_paths = settings.get_asgs_paths()
+
+    converted = 0
+    for layer, path in asgs_paths.items():
+        if path is None or not path.exists():
+            continue
+        if path.suffix.lower() == ".parquet":
+            console.print(f"[green]✓[/green] {layer}: already GeoParquet ({path})")
+            continue
+
+        parquet_path = path.with_suffix(".parquet")
+        console.print(f"Converting {layer}: {path} -> {parquet_path}")
+        gdf = gpd.read_file(path)
+        gdf.to_parquet(parquet_path, schema_version="1.1.0", write_covering_bbox=True)
+        console.print(f"[green]✓[/green] {layer}: wrote {len(gdf)} features")
+        converted += 1
+
+    if converted == 0:
+        console.print("[yellow]No ASGS files found to convert[/yellow]")
+    else:
+        console.print(
+            f"\n[green]✓[/green] Converted {converted} layer(s). "
+            "GeoParquet files are picked up automatically on the next run."
+        )
+
+
 @app.command()
 def info() -> None:
     """Show configuration and system information."""
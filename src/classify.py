@@ -1,52 +1,230 @@
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
-from shapely.geometry import Point
+import shapely
+from shapely.strtree import STRtree
 
 from .settings import get_settings
 
+try:
+    import h3
+except ImportError:
+    h3 = None  # optional - coarse hex pre-filter falls back to the STRtree
+
+try:
+    import numba
+except ImportError:
+    numba = None  # optional - ray-cast falls back to the NumPy version
+
 logger = logging.getLogger(__name__)
 
+# Below this batch size a direct STRtree lookup beats the sjoin machinery
+SJOIN_MIN_BATCH = 32
+
+# Boundary layers at or below this polygon count skip the R-tree entirely:
+# testing every polygon with a vectorized containment call is cheaper than
+# building and querying a spatial index
+SMALL_LAYER_THRESHOLD = 32
+
+# H3 resolution for the coarse cell -> SA1 candidate index (~5 km2 cells)
+H3_RESOLUTION = 7
+
+# Columns loaded from the IARE (Indigenous Areas) layer
+IARE_COLUMNS = ["IAR_CODE21", "IAR_NAME21", "IRE_CODE21", "IRE_NAME21"]
+
+# Columns loaded from the SA1 layer (SA1 boundaries carry the full ASGS hierarchy)
+SA1_HIERARCHY_COLUMNS = [
+    "SA1_CODE",
+    "SA2_CODE",
+    "SA2_NAME",
+    "SA3_CODE",
+    "SA3_NAME",
+    "SA4_CODE",
+    "SA4_NAME",
+    "GCC_CODE",
+    "GCC_NAME",
+    "STE_CODE",
+    "STE_NAME",
+]
+
+
+# Result column -> SA1 layer column for the hierarchy carried on SA1 boundaries
+SA1_HIERARCHY_MAPPING = {
+    "SA1": "SA1_CODE",
+    "SA2_CODE": "SA2_CODE",
+    "SA2_NAME": "SA2_NAME",
+    "SA3_CODE": "SA3_CODE",
+    "SA3_NAME": "SA3_NAME",
+    "SA4_CODE": "SA4_CODE",
+    "SA4_NAME": "SA4_NAME",
+    "GCCSA_CODE": "GCC_CODE",
+    "GCCSA_NAME": "GCC_NAME",
+    "STATE_CODE": "STE_CODE",
+    "STATE_NAME": "STE_NAME",
+}
+
+# Classification columns added to every result frame (SA hierarchy + IARE)
+ABS_CLASSIFICATION_COLUMNS = [
+    "SA1",
+    "SA2_CODE",
+    "SA2_NAME",
+    "SA3_CODE",
+    "SA3_NAME",
+    "SA4_CODE",
+    "SA4_NAME",
+    "GCCSA_CODE",
+    "GCCSA_NAME",
+    "STATE_CODE",
+    "STATE_NAME",
+    "IARE_CODE",
+    "IARE_NAME",
+    "IREG_CODE",
+    "IREG_NAME",
+]
+
+# Result column -> IARE layer column
+IARE_MAPPING = {
+    "IARE_CODE": "IAR_CODE21",
+    "IARE_NAME": "IAR_NAME21",
+    "IREG_CODE": "IRE_CODE21",
+    "IREG_NAME": "IRE_NAME21",
+}
+
+
+@lru_cache(maxsize=None)
+def _layer_available(path: Path | None) -> bool:
+    """Probe a boundary path once per process instead of stat()-ing per call.
+
+    Layer files don't appear or vanish mid-run, so the .exists() syscall is
+    paid once per distinct path rather than on every classify_points call.
+    """
+    return path is not None and path.exists()
+
+
+@lru_cache(maxsize=None)
+def _column_candidates(std_col: str) -> tuple[str, ...]:
+    """Compute the candidate names for a standard column, in preference order.
 
-def load_layer(path: Path, cols: list[str]) -> gpd.GeoDataFrame:
+    Covers the ABS naming conventions: the standard name itself, the GeoPackage
+    `_2021` suffix, the Shapefile `21` suffix, and the GCCSA -> GCC variations.
+    Cached so the string munging happens once per standard name.
+    """
+    gcc_col = std_col.replace("GCCSA", "GCC")
+    return tuple(
+        dict.fromkeys(
+            (
+                std_col,  # Standard name
+                f"{std_col}_2021",  # GeoPackage format
+                f"{std_col}21",  # Shapefile format
+                gcc_col,  # GCCSA -> GCC variation
+                f"{gcc_col}21",  # GCCSA -> GCC21 variation
+            )
+        )
+    )
+
+
+def _resolve_columns(available: list[str], cols: list[str]) -> dict[str, str]:
+    """Map standard column names to the actual names present in a layer.
+
+    Args:
+        available: Column names actually present in the layer
+        cols: Requested column names (using standardized names)
+
+    Returns:
+        Mapping of standard name -> actual column name for columns that resolved
+    """
+    available_set = set(available)
+    column_mapping = {}
+    for std_col in cols:
+        for candidate in _column_candidates(std_col):
+            if candidate in available_set:
+                column_mapping[std_col] = candidate
+                break
+
+    return column_mapping
+
+
+def load_layer(
+    path: Path,
+    cols: list[str],
+    bbox: tuple[float, float, float, float] | None = None,
+) -> gpd.GeoDataFrame:
     """Load a spatial layer keeping only necessary columns.
 
+    Column selection is pushed down into the reader where possible: field names
+    are inspected cheaply first so only the resolved columns (plus geometry)
+    are ever materialized. An optional ``bbox`` (minx, miny, maxx, maxy) is
+    likewise pushed down so features outside the window are never decoded -
+    useful when callers only classify points in a known extent. Loaded layers
+    are cached at module scope, so repeated classification calls in one process
+    skip the GDAL/OGR open and geometry parse entirely; callers must not mutate
+    the returned frame.
+
     Args:
-        path: Path to the spatial data file (GeoPackage, Shapefile, etc.)
+        path: Path to the spatial data file (GeoPackage, Shapefile, GeoParquet, etc.)
         cols: List of column names to keep (using standardized names)
+        bbox: Optional (minx, miny, maxx, maxy) filter in the layer's CRS
 
     Returns:
         GeoDataFrame with specified columns and geometry (columns renamed to standard format)
     """
+    return _load_layer_cached(path, tuple(cols), bbox)
+
+
+@lru_cache(maxsize=16)
+def _load_layer_cached(
+    path: Path,
+    cols: tuple[str, ...],
+    bbox: tuple[float, float, float, float] | None = None,
+) -> gpd.GeoDataFrame:
     if not path.exists():
         raise FileNotFoundError(f"ASGS file not found: {path}")
 
     logger.info(f"Loading spatial layer: {path}")
 
     try:
-        # Load the full dataset first
-        gdf = gpd.read_file(path)
-
-        # Create mapping from standard names to actual column names
-        column_mapping = {}
-        for std_col in cols:
-            # Try different naming conventions
-            candidates = [
-                std_col,  # Standard name
-                f"{std_col}_2021",  # GeoPackage format
-                f"{std_col}21",  # Shapefile format
-                f"{std_col.replace('GCCSA', 'GCC')}",  # GCCSA -> GCC variation
-                f"{std_col.replace('GCCSA', 'GCC')}21",  # GCCSA -> GCC21 variation
-                f"{std_col.replace('STE', 'STE')}21",  # STE21 variation
-            ]
-
-            for candidate in candidates:
-                if candidate in gdf.columns:
-                    column_mapping[std_col] = candidate
-                    break
+        # Inspect the layer's fields without reading the data
+        available = None
+        if path.suffix.lower() == ".parquet":
+            try:
+                import pyarrow.parquet as pq
+
+                available = pq.read_schema(path).names
+            except Exception:
+                available = None
+        else:
+            try:
+                import pyogrio
+
+                available = list(pyogrio.read_info(path)["fields"])
+            except Exception:
+                available = None
+
+        if available is not None:
+            # Push column selection down into the reader
+            column_mapping = _resolve_columns(available, cols)
+            read_cols = list(column_mapping.values()) if column_mapping else None
+            if path.suffix.lower() == ".parquet":
+                parquet_cols = read_cols + ["geometry"] if read_cols else None
+                gdf = gpd.read_parquet(path, columns=parquet_cols, bbox=bbox)
+            else:
+                # use_arrow moves attribute decoding onto contiguous Arrow
+                # buffers instead of one Python object allocation per cell
+                gdf = pyogrio.read_dataframe(path, columns=read_cols, bbox=bbox, use_arrow=True)
+        else:
+            # Fallback: load everything and resolve against the loaded columns
+            if path.suffix.lower() == ".parquet":
+                gdf = gpd.read_parquet(path, bbox=bbox)
+            else:
+                gdf = gpd.read_file(path, bbox=bbox)
+            column_mapping = _resolve_columns(list(gdf.columns), cols)
 
         if not column_mapping:
             logger.warning(
@@ -73,6 +251,339 @@ def load_layer(path: Path, cols: list[str]) -> gpd.GeoDataFrame:
         raise
 
 
+@lru_cache(maxsize=1)
+def _get_sa1_gdf(path: Path) -> gpd.GeoDataFrame:
+    """Load and cache the SA1 boundary layer for repeated classification calls.
+
+    Reading the full SA1 GeoPackage (~60k polygons) dominates per-request latency,
+    so the layer is loaded once and its spatial index built eagerly. The layer
+    stays in its native CRS: reprojecting the handful of query points to match
+    it is far cheaper than transforming every polygon vertex.
+
+    Args:
+        path: Path to the SA1 boundary file
+
+    Returns:
+        GeoDataFrame with SA1 hierarchy columns, in native CRS, spatial index built
+    """
+    sa1_gdf = load_layer(path, SA1_HIERARCHY_COLUMNS)
+
+    # Sort polygons along the Hilbert curve before building the spatial index:
+    # the STRtree packs leaves in insertion order, so spatially-local input
+    # yields tight leaf MBRs with minimal overlap and shorter tree descents
+    try:
+        order = np.argsort(sa1_gdf.hilbert_distance().to_numpy())
+        sa1_gdf = sa1_gdf.iloc[order].reset_index(drop=True)
+    except Exception as e:
+        logger.debug(f"Hilbert presort skipped: {e}")
+
+    # Force R-tree construction now so the first classification isn't penalized
+    _ = sa1_gdf.sindex
+
+    # Prepare geometries in place: containment tests against prepared polygons
+    # use an indexed edge representation instead of scanning every vertex
+    shapely.prepare(sa1_gdf.geometry.values)
+
+    return sa1_gdf
+
+
+@lru_cache(maxsize=1)
+def _get_sa1_cell_index(path: Path) -> dict[str, list[int]]:
+    """Build a coarse H3 cell -> SA1 candidate index over the cached SA1 polygons.
+
+    Cell lookup is an O(1) hash instead of an R-tree descent; cells near SA1
+    boundaries may be missing polygons, so callers must fall back to the STRtree
+    when the candidate test finds no match.
+
+    Args:
+        path: Path to the SA1 boundary file
+
+    Returns:
+        Mapping of H3 cell id to SA1 positions whose polygons cover the cell
+    """
+    sa1_gdf = _get_sa1_gdf(path)
+    if sa1_gdf.crs is not None and not sa1_gdf.crs.is_geographic:
+        # H3 cells are defined over lat/lng; skip the index for projected layers
+        return {}
+
+    cell_to_sa1: dict[str, list[int]] = {}
+    for pos, geom in enumerate(sa1_gdf.geometry):
+        try:
+            cells = h3.geo_to_cells(geom, H3_RESOLUTION)
+        except Exception:
+            continue  # odd geometry - the STRtree fallback still covers it
+        for cell in cells:
+            cell_to_sa1.setdefault(cell, []).append(pos)
+
+    logger.info(f"Built H3 cell index: {len(cell_to_sa1)} cells at resolution {H3_RESOLUTION}")
+    return cell_to_sa1
+
+
+@lru_cache(maxsize=1)
+def _get_sa1_coords_f32(path: Path) -> dict[int, np.ndarray]:
+    """Cache float32 exterior-ring coordinates for simple SA1 polygons.
+
+    SA1 boundaries at ~1m precision fit comfortably in float32, halving the
+    bytes touched per containment test. Polygons with holes or multiple parts
+    are omitted; callers fall back to GEOS for those.
+
+    Args:
+        path: Path to the SA1 boundary file
+
+    Returns:
+        Mapping of SA1 position to a closed (N, 2) float32 ring array
+    """
+    sa1_gdf = _get_sa1_gdf(path)
+
+    coords: dict[int, np.ndarray] = {}
+    for pos, geom in enumerate(sa1_gdf.geometry):
+        if geom is not None and geom.geom_type == "Polygon" and not geom.interiors:
+            coords[pos] = np.asarray(geom.exterior.coords, dtype=np.float32)
+    return coords
+
+
+def _point_in_ring_numpy(px: float, py: float, ring: np.ndarray) -> bool:
+    """Vectorized ray-cast test of a point against a closed ring array.
+
+    Args:
+        px: Point x coordinate (longitude)
+        py: Point y coordinate (latitude)
+        ring: Closed (N, 2) coordinate array of the polygon exterior
+
+    Returns:
+        True if the point falls inside the ring
+    """
+    x1, y1 = ring[:-1, 0], ring[:-1, 1]
+    x2, y2 = ring[1:, 0], ring[1:, 1]
+
+    straddles = (y1 > py) != (y2 > py)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_intersect = x1 + (py - y1) * (x2 - x1) / (y2 - y1)
+    crossings = np.count_nonzero(straddles & (px < x_intersect))
+    return bool(crossings & 1)
+
+
+if numba is not None:
+    # Compiled scalar loop: no boolean temporaries, early edge rejection, and
+    # no NumPy dispatch per call - worthwhile because the ray-cast runs once
+    # per (point, candidate) pair in the hex-cell fast path
+    @numba.njit(cache=True)
+    def _point_in_ring(px: float, py: float, ring: np.ndarray) -> bool:
+        inside = False
+        for i in range(ring.shape[0] - 1):
+            y1 = ring[i, 1]
+            y2 = ring[i + 1, 1]
+            if (y1 > py) != (y2 > py):
+                x_intersect = ring[i, 0] + (py - y1) * (ring[i + 1, 0] - ring[i, 0]) / (y2 - y1)
+                if px < x_intersect:
+                    inside = not inside
+        return inside
+else:
+    _point_in_ring = _point_in_ring_numpy
+
+
+@lru_cache(maxsize=1)
+def _get_sa1_lookup(path: Path) -> pd.DataFrame:
+    """Attribute-only SA1 code -> hierarchy lookup over the cached SA1 layer.
+
+    The SA1 code functionally determines the rest of the ASGS hierarchy
+    (SA2..STE), so once a geometry join has resolved each point's SA1 the
+    remaining columns can be attached with an O(1) hash lookup instead of
+    being carried through the spatial join.
+
+    Args:
+        path: Path to the SA1 boundary file
+
+    Returns:
+        DataFrame of hierarchy columns indexed by (and retaining) SA1_CODE
+    """
+    sa1_gdf = _get_sa1_gdf(path)
+    attrs = pd.DataFrame(sa1_gdf.drop(columns="geometry"))
+    return attrs.drop_duplicates("SA1_CODE").set_index("SA1_CODE", drop=False)
+
+
+@lru_cache(maxsize=1)
+def _get_iare_gdf(path: Path) -> gpd.GeoDataFrame:
+    """Load and cache the IARE boundary layer in its native CRS.
+
+    Query points are reprojected to match the layer (see classify_points);
+    transforming a handful of points is far cheaper than every polygon vertex.
+
+    Args:
+        path: Path to the IARE boundary file
+
+    Returns:
+        GeoDataFrame with IARE columns in the layer's native CRS
+    """
+    iare_gdf = load_layer(path, IARE_COLUMNS)
+
+    # Prepared polygons answer repeat containment tests against the indexed
+    # edge structure instead of rescanning every vertex (same as the SA1 cache)
+    shapely.prepare(iare_gdf.geometry.values)
+
+    return iare_gdf
+
+
+@lru_cache(maxsize=1)
+def _get_sa1_tree(path: Path) -> STRtree:
+    """Build and cache an STRtree over the cached SA1 polygons.
+
+    Args:
+        path: Path to the SA1 boundary file
+
+    Returns:
+        STRtree whose leaf order matches the cached SA1 GeoDataFrame positions
+    """
+    sa1_gdf = _get_sa1_gdf(path)
+    return STRtree(sa1_gdf.geometry.values)
+
+
+def warm_sa1_cache() -> bool:
+    """Preload the SA1 boundary cache if the file is configured and present.
+
+    Returns:
+        True if the cache was warmed, False if SA1 boundaries are unavailable
+    """
+    settings = get_settings()
+    if not _layer_available(settings.asgs_sa1_path):
+        return False
+
+    try:
+        _get_sa1_gdf(settings.asgs_sa1_path)
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to preload SA1 boundaries: {e}")
+        return False
+
+
+def _join_sa1(points: gpd.GeoDataFrame, sa1_gdf: gpd.GeoDataFrame, sa1_path: Path) -> pd.DataFrame:
+    """Match points against the SA1 layer and return the hierarchy columns.
+
+    Picks the cheapest strategy for the layer/batch shape: vectorized
+    containment for tiny layers, direct STRtree lookups for small batches,
+    and a bbox-clipped spatial join otherwise.
+
+    Args:
+        points: GeoDataFrame of query points, already in the layer's CRS
+        sa1_gdf: Cached SA1 boundary layer
+        sa1_path: Path keying the cached STRtree / cell-index / ring caches
+
+    Returns:
+        DataFrame of SA1 hierarchy columns aligned to the points' index
+    """
+    if len(sa1_gdf) <= SMALL_LAYER_THRESHOLD:
+        # Tiny layers: contains_xy tests raw coordinate arrays against each
+        # (prepared) polygon in compiled GEOS - no Point objects, no R-tree
+        lon = points.geometry.x.to_numpy()
+        lat = points.geometry.y.to_numpy()
+        positions = np.full(len(points), -1)
+        for pos, poly in enumerate(sa1_gdf.geometry.values):
+            unmatched = positions < 0
+            if not unmatched.any():
+                break
+            positions[unmatched & shapely.contains_xy(poly, lon, lat)] = pos
+
+        matched = positions >= 0
+        safe_positions = np.where(matched, positions, 0)
+        return pd.DataFrame(
+            {
+                col: np.where(matched, sa1_gdf[col].to_numpy()[safe_positions], None)
+                for col in SA1_HIERARCHY_COLUMNS
+                if col in sa1_gdf.columns
+            },
+            index=points.index,
+        )
+
+    if len(points) < SJOIN_MIN_BATCH:
+        # Small batches: direct STRtree point-in-polygon lookup avoids the
+        # DataFrame alignment overhead of a full spatial join
+        tree = _get_sa1_tree(sa1_path)
+        cell_index = None
+        if h3 is not None:
+            # Empty for projected layers (H3 cells are lat/lng-defined)
+            cell_index = _get_sa1_cell_index(sa1_path) or None
+
+        sa1_geoms = sa1_gdf.geometry.values
+        coords_f32 = _get_sa1_coords_f32(sa1_path)
+        match_positions = []
+        for geom in points.geometry:
+            pos = -1
+
+            # O(1) hex-cell pre-filter when available; typically a handful
+            # of candidate polygons per cell
+            if cell_index is not None:
+                cell = h3.latlng_to_cell(geom.y, geom.x, H3_RESOLUTION)
+                for candidate in cell_index.get(cell, ()):
+                    ring = coords_f32.get(candidate)
+                    if ring is not None:
+                        # Quantized ray-cast over the float32 ring
+                        hit = _point_in_ring(geom.x, geom.y, ring)
+                    else:
+                        # Multipolygon / holes - GEOS is authoritative
+                        hit = sa1_geoms[candidate].contains(geom)
+                    if hit:
+                        pos = candidate
+                        break
+
+            # STRtree covers cell misses (points near SA1 boundaries)
+            if pos < 0:
+                hits = tree.query(geom, predicate="within")
+                if len(hits) > 0:
+                    pos = hits[0]
+
+            match_positions.append(pos)
+
+        return pd.DataFrame(
+            {
+                col: [sa1_gdf[col].iat[pos] if pos >= 0 else None for pos in match_positions]
+                for col in SA1_HIERARCHY_COLUMNS
+                if col in sa1_gdf.columns
+            },
+            index=points.index,
+        )
+
+    # Pre-clip to the points' bounding box: one bbox query against the
+    # layer's R-tree discards the polygons that cannot match (for a
+    # Darwin batch that is ~99% of a national layer) before the sjoin
+    # does its per-point traversals
+    minx, miny, maxx, maxy = points.total_bounds
+    pad = 0.01
+    sa1_window = sa1_gdf.cx[minx - pad : maxx + pad, miny - pad : maxy + pad]
+
+    if "SA1_CODE" not in sa1_window.columns:
+        # Layer without the standard code column - fall back to a plain join
+        return gpd.sjoin(points, sa1_window, how="left", predicate="within")
+
+    # Join geometry against the code column only, then attach the rest of the
+    # hierarchy by hash lookup: SA1 determines SA2..STE, and reindexing the
+    # cached attribute table is far cheaper than carrying ten extra columns
+    # through the sjoin alignment
+    joined = gpd.sjoin(
+        points, sa1_window[["SA1_CODE", "geometry"]], how="left", predicate="within"
+    )
+    hierarchy = _get_sa1_lookup(sa1_path).reindex(joined["SA1_CODE"].to_numpy())
+    hierarchy.index = joined.index
+    return hierarchy
+
+
+def _join_iare(points: gpd.GeoDataFrame, iare_gdf: gpd.GeoDataFrame) -> pd.DataFrame:
+    """Spatially join points against the IARE layer.
+
+    Args:
+        points: GeoDataFrame of query points, already in the layer's CRS
+        iare_gdf: Cached IARE boundary layer
+
+    Returns:
+        Joined DataFrame carrying the IARE columns, aligned to the points' index
+    """
+    # Pre-clip to the points' bounding box (same pruning as the SA1 sjoin)
+    minx, miny, maxx, maxy = points.total_bounds
+    pad = 0.01
+    iare_window = iare_gdf.cx[minx - pad : maxx + pad, miny - pad : maxy + pad]
+
+    return gpd.sjoin(points, iare_window, how="left", predicate="within")
+
+
 def classify_points(df_points: pd.DataFrame) -> pd.DataFrame:
     """Classify geocoded points into Australian statistical areas.
 
@@ -84,138 +595,121 @@ def classify_points(df_points: pd.DataFrame) -> pd.DataFrame:
     """
     settings = get_settings()
 
-    # Initialize result with original data and add ABS columns early
+    # Initialize result with original data and add ABS columns in one block
+    # assign instead of one column insertion per name
     result_df = df_points.copy()
-    abs_columns = [
-        "SA1",
-        "SA2_CODE",
-        "SA2_NAME",
-        "SA3_CODE",
-        "SA3_NAME",
-        "SA4_CODE",
-        "SA4_NAME",
-        "GCCSA_CODE",
-        "GCCSA_NAME",
-        "STATE_CODE",
-        "STATE_NAME",
-        "IARE_CODE",
-        "IARE_NAME",
-        "IREG_CODE",
-        "IREG_NAME",
-    ]
-    for col in abs_columns:
-        result_df[col] = None
-
-    # Filter out rows without coordinates
-    valid_points = df_points.dropna(subset=["Latitude", "Longitude"]).copy()
-    if len(valid_points) == 0:
+    result_df[ABS_CLASSIFICATION_COLUMNS] = None
+
+    # Mask valid coordinates once on raw float arrays and short-circuit
+    # degenerate input before any geometry is constructed
+    lat = pd.to_numeric(df_points["Latitude"], errors="coerce").to_numpy(dtype=float)
+    lon = pd.to_numeric(df_points["Longitude"], errors="coerce").to_numpy(dtype=float)
+    valid = np.isfinite(lat) & np.isfinite(lon)
+    if not valid.any():
         logger.warning("No valid coordinates found for classification")
         return result_df
 
-    logger.info(f"Classifying {len(valid_points)} points into ABS statistical areas")
-
-    # Convert to GeoDataFrame
-    geometry = [
-        Point(lon, lat) for lon, lat in zip(valid_points["Longitude"], valid_points["Latitude"])
-    ]
-    points_gdf = gpd.GeoDataFrame(valid_points, geometry=geometry, crs=settings.default_crs)
+    valid_index = df_points.index[valid]
+    logger.info(f"Classifying {len(valid_index)} points into ABS statistical areas")
+
+    # Geometry-only points frame built straight from the masked arrays: no
+    # attribute columns are dragged through reprojection or the joins, and the
+    # original-row mapping rides on the index
+    geometry = gpd.points_from_xy(lon[valid], lat[valid], crs=settings.default_crs)
+    points_gdf = gpd.GeoDataFrame(geometry=geometry, index=valid_index)
+
+    # Boundary layers stay in their native CRS; reprojecting the (small) points
+    # frame once per distinct layer CRS is far cheaper than transforming every
+    # polygon vertex. Reprojected frames are reused across layers sharing a CRS.
+    points_by_crs: dict[str, gpd.GeoDataFrame] = {str(points_gdf.crs): points_gdf}
+
+    def _points_in(layer_crs) -> gpd.GeoDataFrame:
+        if layer_crs is None:
+            return points_gdf
+        key = str(layer_crs)
+        if key not in points_by_crs:
+            logger.info(f"Reprojecting points from {points_gdf.crs} to {layer_crs}")
+            points_by_crs[key] = points_gdf.to_crs(layer_crs)
+        return points_by_crs[key]
 
     # Use SA1 boundaries which contain all hierarchical information
-    if settings.asgs_sa1_path is None or not settings.asgs_sa1_path.exists():
+    if not _layer_available(settings.asgs_sa1_path):
         logger.warning("SA1 boundaries not found - skipping ABS classification")
         return result_df
 
-    try:
-        # Load SA1 boundaries with all hierarchical columns
-        hierarchy_columns = [
-            "SA1_CODE",
-            "SA2_CODE",
-            "SA2_NAME",
-            "SA3_CODE",
-            "SA3_NAME",
-            "SA4_CODE",
-            "SA4_NAME",
-            "GCC_CODE",
-            "GCC_NAME",
-            "STE_CODE",
-            "STE_NAME",
-        ]
-        sa1_gdf = load_layer(settings.asgs_sa1_path, hierarchy_columns)
-
-        # Ensure CRS matches
-        if sa1_gdf.crs != points_gdf.crs:
-            logger.info(f"Reprojecting SA1 boundaries from {sa1_gdf.crs} to {points_gdf.crs}")
-            sa1_gdf = sa1_gdf.to_crs(points_gdf.crs)
-
-        # Perform single spatial join to get all hierarchical data
-        joined = gpd.sjoin(points_gdf, sa1_gdf, how="left", predicate="within")
-
-        # Map hierarchical columns to result DataFrame
-        hierarchy_mapping = {
-            "SA1": "SA1_CODE",
-            "SA2_CODE": "SA2_CODE",
-            "SA2_NAME": "SA2_NAME",
-            "SA3_CODE": "SA3_CODE",
-            "SA3_NAME": "SA3_NAME",
-            "SA4_CODE": "SA4_CODE",
-            "SA4_NAME": "SA4_NAME",
-            "GCCSA_CODE": "GCC_CODE",
-            "GCCSA_NAME": "GCC_NAME",
-            "STATE_CODE": "STE_CODE",
-            "STATE_NAME": "STE_NAME",
-        }
-
-        # Update only the rows that had valid coordinates
-        valid_indices = valid_points.index
-        for result_col, source_col in hierarchy_mapping.items():
-            if source_col in joined.columns:
-                result_df.loc[valid_indices, result_col] = joined[source_col].values
-
-        logger.info("Successfully classified points using SA1 hierarchical boundaries")
+    # Collect the independent per-layer joins. Layer loads and point
+    # reprojections stay on this thread (they touch the shared caches); the
+    # submitted tasks only run GEOS predicates, which release the GIL.
+    tasks: list[tuple[str, dict[str, str], partial]] = []
 
+    try:
+        # Cached SA1 boundaries with all hierarchical columns (loaded once per process)
+        sa1_gdf = _get_sa1_gdf(settings.asgs_sa1_path)
+        sa1_points = _points_in(sa1_gdf.crs)
+        tasks.append(
+            (
+                "SA1 hierarchical",
+                SA1_HIERARCHY_MAPPING,
+                partial(_join_sa1, sa1_points, sa1_gdf, settings.asgs_sa1_path),
+            )
+        )
     except Exception as e:
         logger.error(f"Error processing SA1 hierarchical classification: {e}")
         return result_df
 
     # IARE (Indigenous Areas) classification
-    if settings.asgs_iare_path is None or not settings.asgs_iare_path.exists():
+    if not _layer_available(settings.asgs_iare_path):
         logger.info("IARE boundaries not found - skipping Indigenous Areas classification")
     else:
         try:
-            # Load IARE boundaries
-            iare_columns = ["IAR_CODE21", "IAR_NAME21", "IRE_CODE21", "IRE_NAME21"]
-            iare_gdf = load_layer(settings.asgs_iare_path, iare_columns)
-
-            # Ensure CRS matches - IARE uses EPSG:7844 (GDA2020)
-            if iare_gdf.crs != points_gdf.crs:
-                logger.info(f"Reprojecting IARE boundaries from {iare_gdf.crs} to {points_gdf.crs}")
-                iare_gdf = iare_gdf.to_crs(points_gdf.crs)
-
-            # Perform spatial join for IARE classification
-            iare_joined = gpd.sjoin(points_gdf, iare_gdf, how="left", predicate="within")
-
-            # Map IARE columns to result DataFrame
-            iare_mapping = {
-                "IARE_CODE": "IAR_CODE21",
-                "IARE_NAME": "IAR_NAME21",
-                "IREG_CODE": "IRE_CODE21",
-                "IREG_NAME": "IRE_NAME21",
-            }
-
-            # Update only the rows that had valid coordinates
-            valid_indices = valid_points.index
-            for result_col, source_col in iare_mapping.items():
-                if source_col in iare_joined.columns:
-                    result_df.loc[valid_indices, result_col] = iare_joined[source_col].values
-
-            logger.info("Successfully classified points using IARE boundaries")
-
+            # Cached IARE boundaries in their native CRS; reuse the points
+            # already reprojected for SA1 when the layers share a CRS
+            iare_gdf = _get_iare_gdf(settings.asgs_iare_path)
+            iare_points = _points_in(iare_gdf.crs)
+            tasks.append(("IARE", IARE_MAPPING, partial(_join_iare, iare_points, iare_gdf)))
         except Exception as e:
             logger.error(f"Error processing IARE classification: {e}")
 
+    # Run independent layer joins concurrently when there is more than one
+    if len(tasks) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as executor:
+            submitted = [(name, mapping, executor.submit(task)) for name, mapping, task in tasks]
+        joined_results = []
+        for name, mapping, future in submitted:
+            try:
+                joined_results.append((name, mapping, future.result()))
+            except Exception as e:
+                logger.error(f"Error processing {name} classification: {e}")
+    else:
+        joined_results = []
+        for name, mapping, task in tasks:
+            try:
+                joined_results.append((name, mapping, task()))
+            except Exception as e:
+                logger.error(f"Error processing {name} classification: {e}")
+
+    for name, mapping, joined in joined_results:
+        # Update only the rows that had valid coordinates (single block assign
+        # instead of one .loc setitem per column)
+        renamed = {
+            result_col: joined[source_col].values
+            for result_col, source_col in mapping.items()
+            if source_col in joined.columns
+        }
+        if renamed:
+            result_df.update(pd.DataFrame(renamed, index=valid_index))
+
+        logger.info(f"Successfully classified points using {name} boundaries")
+
+    # Classification codes and names repeat massively across rows; categoricals
+    # store one small integer code per row plus a single copy of each unique
+    # string, shrinking the frame and downstream value_counts/Parquet writes
+    for col in ABS_CLASSIFICATION_COLUMNS:
+        result_df[col] = result_df[col].astype("category")
+
     # Log classification success rate
-    classified_count = result_df[abs_columns].notna().any(axis=1).sum()
-    total_valid = len(valid_points)
+    classified_count = result_df[ABS_CLASSIFICATION_COLUMNS].notna().any(axis=1).sum()
+    total_valid = len(valid_index)
     logger.info(f"Classification complete: {classified_count}/{total_valid} points classified")
 
     return result_df
@@ -231,34 +725,27 @@ def get_classification_summary(df: pd.DataFrame) -> dict[str, Any]:
         Dictionary with summary statistics
     """
     total_points = len(df)
-    geocoded_points = df[["Latitude", "Longitude"]].notna().all(axis=1).sum()
-
-    abs_columns = [
-        "SA1",
-        "SA2_CODE",
-        "SA2_NAME",
-        "SA3_CODE",
-        "SA3_NAME",
-        "SA4_CODE",
-        "SA4_NAME",
-        "GCCSA_CODE",
-        "GCCSA_NAME",
-        "STATE_CODE",
-        "STATE_NAME",
-        "IARE_CODE",
-        "IARE_NAME",
-        "IREG_CODE",
-        "IREG_NAME",
-    ]
-    available_abs_columns = [col for col in abs_columns if col in df.columns]
-
-    if available_abs_columns:
-        classified_points = df[available_abs_columns].notna().any(axis=1).sum()
-    else:
-        classified_points = 0
 
-    # Count classifications by state
-    state_counts = df["STATE_NAME"].value_counts().to_dict() if "STATE_NAME" in df.columns else {}
+    # Combine per-column masks directly rather than materializing boolean
+    # DataFrames for .all/.any reductions
+    geocoded_mask = (df["Latitude"].notna() & df["Longitude"].notna()).to_numpy()
+    geocoded_points = int(geocoded_mask.sum())
+
+    available_abs_columns = [col for col in ABS_CLASSIFICATION_COLUMNS if col in df.columns]
+
+    classified_mask = np.zeros(total_points, dtype=bool)
+    for col in available_abs_columns:
+        classified_mask |= df[col].notna().to_numpy()
+    classified_points = int(classified_mask.sum())
+
+    # Count classifications by state with a single groupby kernel: for the
+    # categorical STATE_NAME column this tallies the integer codes directly
+    # (observed=True skips empty categories) without materializing strings
+    if "STATE_NAME" in df.columns:
+        state_sizes = df.groupby("STATE_NAME", observed=True).size()
+        state_counts = {state: int(count) for state, count in state_sizes.items()}
+    else:
+        state_counts = {}
 
     return {
         "total_locations": total_points,
@@ -0,0 +1,111 @@
+import logging
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Resolved coordinates are stable; keep hits for a month
+POSITIVE_TTL_SEC = 30 * 86400
+
+# Misses get a short TTL: a name unknown today may be added to OSM, but
+# re-hitting Nominatim for it on every run within a day is pure waste
+NEGATIVE_TTL_SEC = 86400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS geocode_cache (
+    key TEXT PRIMARY KEY,
+    lat REAL,
+    lon REAL,
+    address TEXT,
+    ts INTEGER
+)
+"""
+
+
+class GeocodeCache:
+    """SQLite-backed key-value cache of geocoding results.
+
+    Keyed by normalized location name, so localities resolved in earlier runs
+    (or earlier in the same run) skip the Nominatim round trip entirely. Hits
+    are additionally memoized in memory so duplicates within a batch avoid
+    even the disk lookup. Misses are negative-cached with a shorter TTL so
+    known-bad names don't burn a rate-limited request per run.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._memory: dict[str, dict[str, Any]] = {}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(_SCHEMA)
+            # Migrate pre-TTL databases in place; rows without a timestamp
+            # are treated as freshly written
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(geocode_cache)")}
+            if "ts" not in columns:
+                conn.execute("ALTER TABLE geocode_cache ADD COLUMN ts INTEGER")
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection per operation keeps the cache trivially thread-safe;
+        # the cost is negligible next to the network call it replaces
+        return sqlite3.connect(self.path)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached {lat, lon, address} for a key, or None on miss.
+
+        A returned dict with lat/lon of None is a negative-cache hit: the name
+        was recently looked up and Nominatim had no result for it.
+        """
+        if key in self._memory:
+            return self._memory[key]
+
+        # Lock-free read: each operation has its own connection and SQLite
+        # supports concurrent readers, so parallel batch workers' lookups
+        # overlap instead of queueing on the instance lock (writes still
+        # serialize through it)
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT lat, lon, address, ts FROM geocode_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        lat, lon, address, ts = row
+        ttl = POSITIVE_TTL_SEC if lat is not None else NEGATIVE_TTL_SEC
+        if ts is not None and time.time() - ts > ttl:
+            return None
+
+        result = {"lat": lat, "lon": lon, "address": address}
+        self._memory[key] = result
+        return result
+
+    def set(self, key: str, lat: float, lon: float, address: str | None) -> None:
+        """Store a successful geocoding result."""
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO geocode_cache (key, lat, lon, address, ts) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, lat, lon, address, int(time.time())),
+            )
+        self._memory[key] = {"lat": lat, "lon": lon, "address": address}
+
+    def set_miss(self, key: str) -> None:
+        """Negative-cache a name Nominatim found no result for."""
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO geocode_cache (key, lat, lon, address, ts) "
+                "VALUES (?, NULL, NULL, NULL, ?)",
+                (key, int(time.time())),
+            )
+        self._memory[key] = {"lat": None, "lon": None, "address": None}
+
+
+@lru_cache(maxsize=1)
+def get_geocode_cache(data_dir: Path) -> GeocodeCache:
+    """Get the cache instance stored under the given data directory."""
+    return GeocodeCache(data_dir / "geocode_cache.sqlite")
@@ -1,16 +1,81 @@
+import io
 import logging
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Arrow's CSV parser reads and type-infers column chunks in parallel; fall
+# back to the pandas C engine when pyarrow is missing
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pc = None
+    pacsv = None
 
-def read_locations_file(path: Path, required_columns: list[str] | None = None) -> pd.DataFrame:
+# Below this size the Arrow parser's setup cost outweighs its parallelism
+_PYARROW_MIN_BYTES = 1_000_000
+
+# Above this row count the Arrow CSV writer's buffered chunk encoding beats
+# DataFrame.to_csv's per-row Python formatting
+_ARROW_WRITE_MIN_ROWS = 10_000
+
+
+def _read_csv_fast(path: Path) -> pd.DataFrame:
+    """Read a CSV, using Arrow's multithreaded parser for large files.
+
+    The file is pulled into memory with one read (no separate stat - the size
+    check runs on the bytes) and parsed from there. The resulting frame uses
+    the same NumPy-backed dtypes as pd.read_csv (empty strings arrive as NaN),
+    so callers see identical semantics.
+    """
+    raw = path.read_bytes()
+
+    if pacsv is not None and len(raw) > _PYARROW_MIN_BYTES:
+        try:
+            table = pacsv.read_csv(
+                io.BytesIO(raw),
+                read_options=pacsv.ReadOptions(use_threads=True),
+                convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+            )
+            # self_destruct frees the Arrow buffers as blocks are converted,
+            # halving peak memory during the handoff
+            return table.to_pandas(self_destruct=True)
+        except Exception as e:
+            logger.debug(f"Arrow CSV read failed for {path}, using pandas: {e}")
+
+    return pd.read_csv(io.BytesIO(raw))
+
+
+def _non_blank_mask(s: pd.Series) -> np.ndarray:
+    """Boolean mask of values that are non-null and not whitespace-only.
+
+    With pyarrow this is a single SIMD trim + length pass over a contiguous
+    string buffer; the pandas fallback dispatches str.strip/str.len across
+    Python objects.
+    """
+    if pc is not None:
+        arr = pa.array(s, from_pandas=True)
+        if pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type):
+            mask = pc.greater(pc.utf8_length(pc.utf8_trim_whitespace(arr)), 0)
+            # Nulls propagate through the kernels; treat them as blank
+            return pc.fill_null(mask, False).to_numpy(zero_copy_only=False)
+    return (s.notna() & (s.str.strip().str.len() > 0)).to_numpy()
+
+
+def read_locations_file(
+    path: Path | io.IOBase, required_columns: list[str] | None = None
+) -> pd.DataFrame:
     """Read and validate a locations file (CSV or TXT).
 
     Args:
-        path: Path to the CSV or TXT file
+        path: Path to the CSV or TXT file, or an open file-like object with
+            CSV content (lets tests and piped input skip the disk entirely)
         required_columns: List of required column names (only for CSV)
 
     Returns:
@@ -20,30 +85,33 @@ def read_locations_file(path: Path, required_columns: list[str] | None = None) -
         FileNotFoundError: If the file doesn't exist
         ValueError: If required columns are missing
     """
-    if not path.exists():
-        raise FileNotFoundError(f"Input file not found: {path}")
-
     logger.info(f"Reading locations from: {path}")
 
+    # EAFP: let the open fail rather than paying a separate stat() first
     try:
         # Handle .txt files (raw locality names)
-        if path.suffix.lower() == ".txt":
-            with open(path, encoding="utf-8") as f:
-                lines = [line.strip() for line in f if line.strip()]
+        if isinstance(path, Path) and path.suffix.lower() == ".txt":
+            # One C-level read + vectorized concat instead of materializing the
+            # lines into two Python lists
+            df = pd.read_csv(
+                path,
+                header=None,
+                names=["Original_CHC"],
+                dtype="string",
+                skip_blank_lines=True,
+                sep="\x1f",  # sentinel delimiter: each full line is one value
+            )
+            df["Original_CHC"] = df["Original_CHC"].str.strip()
+            df = df[df["Original_CHC"] != ""]
 
             # Convert to qualified names with NT, Australia, but preserve original
-            qualified_names = [f"{name}, NT, Australia" for name in lines]
-            df = pd.DataFrame(
-                {
-                    "CHC": qualified_names,
-                    "Original_CHC": lines,  # Preserve original names
-                }
-            )
-            logger.info(f"Converted {len(lines)} raw locality names to qualified format")
+            df["CHC"] = df["Original_CHC"] + ", NT, Australia"
+            df = df[["CHC", "Original_CHC"]]
+            logger.info(f"Converted {len(df)} raw locality names to qualified format")
 
-        # Handle .csv files
+        # Handle .csv files and in-memory buffers
         else:
-            df = pd.read_csv(path)
+            df = _read_csv_fast(path) if isinstance(path, Path) else pd.read_csv(path)
 
             # Validate required columns
             if required_columns:
@@ -56,21 +124,27 @@ def read_locations_file(path: Path, required_columns: list[str] | None = None) -
 
         logger.info(f"Loaded {len(df)} locations")
 
-        # Remove rows with empty location names
+        # Remove rows with empty location names - one combined mask, one pass
         if "CHC" in df.columns:
-            initial_count = len(df)
-            df = df.dropna(subset=["CHC"])
-            df = df[df["CHC"].str.strip() != ""]
-            if len(df) < initial_count:
-                logger.info(f"Removed {initial_count - len(df)} rows with empty location names")
+            mask = _non_blank_mask(df["CHC"])
+            removed = len(df) - int(mask.sum())
+            if removed:
+                df = df.loc[mask]
+                logger.info(f"Removed {removed} rows with empty location names")
 
         return df
 
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file not found: {path}") from None
     except Exception as e:
         logger.error(f"Error reading file {path}: {e}")
         raise
 
 
+# Backwards-compatible alias; the CSV-only name predates .txt support
+read_locations_csv = read_locations_file
+
+
 def restore_original_names(df: pd.DataFrame) -> pd.DataFrame:
     """Restore original CHC names in the final output.
 
@@ -81,10 +155,9 @@ def restore_original_names(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with original CHC names restored
     """
     if "Original_CHC" in df.columns:
-        # Replace CHC column with original names and drop the Original_CHC column
-        result_df = df.copy()
-        result_df["CHC"] = result_df["Original_CHC"]
-        result_df = result_df.drop(columns=["Original_CHC"])
+        # drop + assign shares the unrelated column blocks instead of deep-
+        # copying the whole frame
+        result_df = df.assign(CHC=df["Original_CHC"].values).drop(columns=["Original_CHC"])
         logger.info("Restored original CHC names in output")
         return result_df
     else:
@@ -92,12 +165,17 @@ def restore_original_names(df: pd.DataFrame) -> pd.DataFrame:
         return df
 
 
-def write_output_csv(df: pd.DataFrame, path: Path = Path("outputs/chc_classified.csv")) -> None:
+def write_output_csv(
+    df: pd.DataFrame,
+    path: Path = Path("outputs/chc_classified.csv"),
+    write_parquet: bool = True,
+) -> None:
     """Write results to CSV file.
 
     Args:
         df: DataFrame to write
         path: Output file path
+        write_parquet: Also write the columnar .parquet sidecar (default True)
     """
     # Ensure output directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -105,13 +183,36 @@ def write_output_csv(df: pd.DataFrame, path: Path = Path("outputs/chc_classified
     logger.info(f"Writing {len(df)} results to: {path}")
 
     try:
-        df.to_csv(path, index=False)
+        # Large frames go through Arrow's CSV writer: it encodes column chunks
+        # into a large internal buffer and flushes in big writes, instead of
+        # to_csv's row-at-a-time Python formatting and many small writes
+        if pacsv is not None and len(df) >= _ARROW_WRITE_MIN_ROWS:
+            try:
+                pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+            except Exception as e:
+                logger.debug(f"Arrow CSV write failed for {path}, using pandas: {e}")
+                df.to_csv(path, index=False)
+        else:
+            df.to_csv(path, index=False)
         logger.info(f"Successfully wrote output to {path}")
 
     except Exception as e:
         logger.error(f"Error writing CSV file {path}: {e}")
         raise
 
+    # Parquet sidecar: load_existing_cache prefers it on reload, skipping the
+    # CSV re-parse of coordinates. CSV remains the human-readable artifact.
+    if write_parquet:
+        try:
+            df.to_parquet(
+                path.with_suffix(".parquet"),
+                engine="pyarrow",
+                compression="snappy",
+                index=False,
+            )
+        except Exception as e:
+            logger.warning(f"Could not write parquet sidecar for {path}: {e}")
+
 
 def validate_geocoded_data(df: pd.DataFrame, min_success_rate: float = 0.8) -> bool:
     """Validate geocoded data meets quality requirements.
@@ -128,8 +229,12 @@ def validate_geocoded_data(df: pd.DataFrame, min_success_rate: float = 0.8) -> b
         logger.error("No locations to validate")
         return False
 
-    # Check geocoding success rate
-    geocoded_count = df[["Latitude", "Longitude"]].notna().all(axis=1).sum()
+    # Check geocoding success rate on raw float arrays: plain NumPy comparisons
+    # skip the per-operation index alignment that Series masks pay
+    lat_arr = pd.to_numeric(df["Latitude"], errors="coerce").to_numpy(dtype=float)
+    lon_arr = pd.to_numeric(df["Longitude"], errors="coerce").to_numpy(dtype=float)
+    geocoded_mask = ~np.isnan(lat_arr) & ~np.isnan(lon_arr)
+    geocoded_count = int(geocoded_mask.sum())
     success_rate = geocoded_count / total_locations
 
     logger.info(f"Geocoding success rate: {success_rate:.1%} ({geocoded_count}/{total_locations})")
@@ -143,21 +248,20 @@ def validate_geocoded_data(df: pd.DataFrame, min_success_rate: float = 0.8) -> b
     # Check for obviously invalid coordinates (outside Australia)
     # Australia bounding box: roughly -44 to -10 latitude, 113 to 154 longitude
     if geocoded_count > 0:
-        valid_coords = df.dropna(subset=["Latitude", "Longitude"])
-        invalid_coords = valid_coords[
-            (valid_coords["Latitude"] < -44)
-            | (valid_coords["Latitude"] > -10)
-            | (valid_coords["Longitude"] < 113)
-            | (valid_coords["Longitude"] > 154)
-        ]
-
-        if len(invalid_coords) > 0:
-            logger.warning(f"Found {len(invalid_coords)} coordinates outside Australia bounds")
-            for _, row in invalid_coords.iterrows():
-                logger.warning(
-                    f"  {row.get('CHC', 'Unknown')}: "
-                    f"({row['Latitude']:.4f}, {row['Longitude']:.4f})"
-                )
+        # Clip-and-compare packs the four bound tests into two fused min/max
+        # passes: a coordinate is inside the box iff clipping doesn't move it
+        # (NaNs compare unequal, so they never count as inside)
+        in_au = (np.clip(lat_arr, -44, -10) == lat_arr) & (np.clip(lon_arr, 113, 154) == lon_arr)
+        invalid_mask = geocoded_mask & ~in_au
+
+        invalid_count = int(invalid_mask.sum())
+        if invalid_count > 0:
+            # One formatted dump instead of boxing each invalid row into a Series
+            display_cols = [c for c in ("CHC", "Latitude", "Longitude") if c in df.columns]
+            logger.warning(
+                f"Found {invalid_count} coordinates outside Australia bounds:\n"
+                + df.loc[invalid_mask, display_cols].to_string(index=False)
+            )
 
     logger.info("Geocoded data validation passed")
     return True
@@ -207,24 +311,39 @@ def load_existing_cache(cache_path: Path) -> pd.DataFrame:
     Returns:
         DataFrame with previously processed locations, or empty DataFrame if no cache
     """
-    if not cache_path.exists():
-        logger.info(f"No existing cache found at {cache_path}")
-        return pd.DataFrame()
+    # Prefer the parquet sidecar written by write_output_csv - columnar load
+    # with preserved dtypes instead of re-parsing coordinate floats from CSV.
+    # The CSV stays authoritative: deleting or hand-editing it is the
+    # established way to invalidate the resume cache, so the sidecar is only
+    # trusted while the CSV exists and hasn't been modified after it.
+    parquet_path = cache_path.with_suffix(".parquet")
+    try:
+        if cache_path.stat().st_mtime <= parquet_path.stat().st_mtime:
+            cache_df = pd.read_parquet(parquet_path, engine="pyarrow")
+            logger.info(f"Loaded cache with {len(cache_df)} locations from {parquet_path}")
+            return cache_df
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to load parquet cache from {parquet_path}: {e}")
 
     try:
-        cache_df = pd.read_csv(cache_path)
+        cache_df = _read_csv_fast(cache_path)
         logger.info(f"Loaded cache with {len(cache_df)} locations from {cache_path}")
         return cache_df
+    except (FileNotFoundError, pd.errors.EmptyDataError):
+        logger.info(f"No existing cache found at {cache_path}")
+        return pd.DataFrame()
     except Exception as e:
         logger.warning(f"Failed to load cache from {cache_path}: {e}")
         return pd.DataFrame()
 
 
-def is_location_complete(row: pd.Series) -> bool:
+def is_location_complete(row: pd.Series | dict) -> bool:
     """Check if a location has complete geocoding and classification data.
 
     Args:
-        row: DataFrame row to check
+        row: DataFrame row (or plain record dict) to check
 
     Returns:
         True if location has coordinates and SA1 classification
@@ -236,11 +355,11 @@ def is_location_complete(row: pd.Series) -> bool:
     )
 
 
-def is_location_geocoded(row: pd.Series) -> bool:
+def is_location_geocoded(row: pd.Series | dict) -> bool:
     """Check if a location has geocoding data (coordinates).
 
     Args:
-        row: DataFrame row to check
+        row: DataFrame row (or plain record dict) to check
 
     Returns:
         True if location has coordinates
@@ -270,14 +389,19 @@ def merge_with_cache(
         logger.info(f"{mode}: processing all {len(input_df)} locations")
         return input_df.copy(), pd.DataFrame(), pd.DataFrame()
 
-    # Find matches between input and cache based on CHC name
-    cache_dict = {row["CHC"]: row for _, row in cache_df.iterrows()}
+    # Zero-row slices keep the input schema, so empty partitions concat with
+    # non-empty ones without upcasting every column to object
+    empty_like = input_df.iloc[0:0].copy()
+
+    # Find matches between input and cache based on CHC name. Plain dict rows
+    # avoid the per-row Series boxing that iterrows incurs.
+    cache_dict = {record["CHC"]: record for record in cache_df.to_dict("records")}
 
     to_geocode_list = []
     to_classify_list = []
     already_complete_list = []
 
-    for _, input_row in input_df.iterrows():
+    for input_row in input_df.to_dict("records"):
         chc_name = input_row["CHC"]
 
         if chc_name in cache_dict:
@@ -288,12 +412,14 @@ def merge_with_cache(
                 already_complete_list.append(cached_row)
             elif is_location_geocoded(cached_row):
                 # Geocoded but not classified - needs classification only
-                # Create row with geocoding data for classification
-                row_for_classification = input_row.copy()
-                row_for_classification["Latitude"] = cached_row["Latitude"]
-                row_for_classification["Longitude"] = cached_row["Longitude"]
-                row_for_classification["Address"] = cached_row.get("Address", "")
-                to_classify_list.append(row_for_classification)
+                to_classify_list.append(
+                    {
+                        **input_row,
+                        "Latitude": cached_row["Latitude"],
+                        "Longitude": cached_row["Longitude"],
+                        "Address": cached_row.get("Address", ""),
+                    }
+                )
             else:
                 # Incomplete - needs full processing
                 to_geocode_list.append(input_row)
@@ -302,15 +428,15 @@ def merge_with_cache(
             to_geocode_list.append(input_row)
 
     to_geocode_df = (
-        pd.DataFrame(to_geocode_list) if to_geocode_list else pd.DataFrame(columns=input_df.columns)
+        pd.DataFrame.from_records(to_geocode_list) if to_geocode_list else empty_like.copy()
     )
     to_classify_df = (
-        pd.DataFrame(to_classify_list)
-        if to_classify_list
-        else pd.DataFrame(columns=input_df.columns)
+        pd.DataFrame.from_records(to_classify_list) if to_classify_list else empty_like.copy()
     )
     already_complete_df = (
-        pd.DataFrame(already_complete_list) if already_complete_list else pd.DataFrame()
+        pd.DataFrame.from_records(already_complete_list)
+        if already_complete_list
+        else cache_df.iloc[0:0].copy()
     )
 
     logger.info(
@@ -322,30 +448,36 @@ def merge_with_cache(
     return to_geocode_df, to_classify_df, already_complete_df
 
 
+# Sample CHC locations for the bundled demo file
+_SAMPLE_LOCATIONS = (
+    "Adelaide River CHC, NT, Australia",
+    "Ali Curung CHC, NT, Australia",
+    "Alpurrurulam CHC, NT, Australia",
+    "Ampilatwatja CHC, NT, Australia",
+    "Amunturrngu CHC, NT, Australia",
+    "Angurugu CHC, NT, Australia",
+    "Aputula CHC, NT, Australia",
+    "Areyonga CHC, NT, Australia",
+    "Atitjere CHC, NT, Australia",
+    "Batchelor CHC, NT, Australia",
+)
+
+# CSV bytes rendered once at import; every value is quoted because the
+# location names themselves contain commas
+_SAMPLE_CSV_BYTES = (
+    '"CHC"\n' + "\n".join(f'"{name}"' for name in _SAMPLE_LOCATIONS) + "\n"
+).encode()
+
+
 def create_sample_locations_file(output_path: Path) -> None:
     """Create a sample locations CSV file for testing.
 
     Args:
         output_path: Path where to create the sample file
     """
-    sample_locations = [
-        "Adelaide River CHC, NT, Australia",
-        "Ali Curung CHC, NT, Australia",
-        "Alpurrurulam CHC, NT, Australia",
-        "Ampilatwatja CHC, NT, Australia",
-        "Amunturrngu CHC, NT, Australia",
-        "Angurugu CHC, NT, Australia",
-        "Aputula CHC, NT, Australia",
-        "Areyonga CHC, NT, Australia",
-        "Atitjere CHC, NT, Australia",
-        "Batchelor CHC, NT, Australia",
-    ]
-
-    df = pd.DataFrame({"CHC": sample_locations})
-
     # Ensure directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write CSV with proper quoting for locations with commas
-    df.to_csv(output_path, index=False, quoting=1)  # QUOTE_ALL
+    # Static content: one write syscall instead of a DataFrame build + encode
+    output_path.write_bytes(_SAMPLE_CSV_BYTES)
     logger.info(f"Created sample locations file: {output_path}")
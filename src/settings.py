@@ -1,3 +1,4 @@
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
@@ -11,6 +12,9 @@ class Settings:
     nominatim_user_agent: str = "chc_geocoder"
     nominatim_url: str = "https://nominatim.openstreetmap.org"
     geocode_min_delay_sec: float = 1.0
+    # Structured queries (city/state/country) hit fewer false negatives than
+    # free-form strings and avoid the fallback round trip in the common case
+    use_structured_query: bool = True
 
     # ASGS (Australian Statistical Geography Standard) file paths
     asgs_sa1_path: Path | None = None
@@ -35,6 +39,8 @@ class Settings:
             nominatim_user_agent=os.getenv("NOMINATIM_USER_AGENT", "chc_geocoder"),
             nominatim_url=os.getenv("NOMINATIM_URL", "https://nominatim.openstreetmap.org"),
             geocode_min_delay_sec=float(os.getenv("GEOCODE_MIN_DELAY_SEC", "1.0")),
+            use_structured_query=os.getenv("USE_STRUCTURED_QUERY", "true").lower()
+            in ("1", "true", "yes"),
             asgs_sa1_path=cls._path_from_env("ASGS_SA1_PATH"),
             asgs_sa2_path=cls._path_from_env("ASGS_SA2_PATH"),
             asgs_sa3_path=cls._path_from_env("ASGS_SA3_PATH"),
@@ -67,49 +73,38 @@ class Settings:
 
     def set_default_asgs_paths(self, asgs_dir: Path) -> None:
         """Set default ASGS paths based on a directory containing ASGS files."""
-        # Try GeoPackage format first
-        gpkg_files = {
-            "sa1": asgs_dir / "SA1_2021_AUST_GDA2020.gpkg",
-            "sa2": asgs_dir / "SA2_2021_AUST_GDA2020.gpkg",
-            "sa3": asgs_dir / "SA3_2021_AUST_GDA2020.gpkg",
-            "sa4": asgs_dir / "SA4_2021_AUST_GDA2020.gpkg",
-            "gccsa": asgs_dir / "GCCSA_2021_AUST_GDA2020.gpkg",
-            "ste": asgs_dir / "STE_2021_AUST_GDA2020.gpkg",
-            "iare": asgs_dir / "IARE_2021_AUST_GDA2020.gpkg",
+        # Base file names and the shapefile subdirectory each layer ships in
+        layer_names = {
+            "sa1": ("SA1_2021_AUST_GDA2020", "SA1_2021_AUST_SHP_GDA2020"),
+            "sa2": ("SA2_2021_AUST_GDA2020", "SA2_2021_AUST_SHP_GDA2020"),
+            "sa3": ("SA3_2021_AUST_GDA2020", "SA3_2021_AUST_SHP_GDA2020"),
+            "sa4": ("SA4_2021_AUST_GDA2020", "SA4_2021_AUST_SHP_GDA2020"),
+            "gccsa": ("GCCSA_2021_AUST_GDA2020", "GCCSA_2021_AUST_SHP_GDA2020"),
+            "ste": ("STE_2021_AUST_GDA2020", "STE_2021_AUST_SHP_GDA2020"),
+            "iare": ("IARE_2021_AUST_GDA2020", "IARE_2021_AUST_GDA2020_SHP"),
         }
 
-        # Try Shapefile format as fallback (both in subdirectories and loose files)
-        shp_files = {
-            "sa1": asgs_dir / "SA1_2021_AUST_SHP_GDA2020" / "SA1_2021_AUST_GDA2020.shp",
-            "sa2": asgs_dir / "SA2_2021_AUST_SHP_GDA2020" / "SA2_2021_AUST_GDA2020.shp",
-            "sa3": asgs_dir / "SA3_2021_AUST_SHP_GDA2020" / "SA3_2021_AUST_GDA2020.shp",
-            "sa4": asgs_dir / "SA4_2021_AUST_SHP_GDA2020" / "SA4_2021_AUST_GDA2020.shp",
-            "gccsa": asgs_dir / "GCCSA_2021_AUST_SHP_GDA2020" / "GCCSA_2021_AUST_GDA2020.shp",
-            "ste": asgs_dir / "STE_2021_AUST_SHP_GDA2020" / "STE_2021_AUST_GDA2020.shp",
-            "iare": asgs_dir / "IARE_2021_AUST_GDA2020_SHP" / "IARE_2021_AUST_GDA2020.shp",
-        }
-
-        # Try loose shapefile format (files directly in asgs directory)
-        loose_shp_files = {
-            "sa1": asgs_dir / "SA1_2021_AUST_GDA2020.shp",
-            "sa2": asgs_dir / "SA2_2021_AUST_GDA2020.shp",
-            "sa3": asgs_dir / "SA3_2021_AUST_GDA2020.shp",
-            "sa4": asgs_dir / "SA4_2021_AUST_GDA2020.shp",
-            "gccsa": asgs_dir / "GCCSA_2021_AUST_GDA2020.shp",
-            "ste": asgs_dir / "STE_2021_AUST_GDA2020.shp",
-            "iare": asgs_dir / "IARE_2021_AUST_GDA2020.shp",
-        }
-
-        # Set paths, preferring existing files in order: gpkg > shp in subdirs > loose shp
-        def _get_existing_path(key):
-            if gpkg_files[key].exists():
-                return gpkg_files[key]
-            elif shp_files[key].exists():
-                return shp_files[key]
-            elif loose_shp_files[key].exists():
-                return loose_shp_files[key]
-            else:
-                return None
+        # One directory read instead of stat()-ing every candidate path;
+        # membership checks in the name set are then free
+        try:
+            entries = {entry.name for entry in os.scandir(asgs_dir)}
+        except OSError:
+            entries = set()
+
+        def _get_existing_path(key: str) -> Path | None:
+            base, shp_subdir = layer_names[key]
+            # Preference order: parquet > gpkg > shp in subdir > loose shp
+            # (parquet is fastest to load - see the convert-asgs CLI command)
+            for name in (f"{base}.parquet", f"{base}.gpkg"):
+                if name in entries:
+                    return asgs_dir / name
+            if shp_subdir in entries:
+                candidate = asgs_dir / shp_subdir / f"{base}.shp"
+                if candidate.exists():
+                    return candidate
+            if f"{base}.shp" in entries:
+                return asgs_dir / f"{base}.shp"
+            return None
 
         self.asgs_sa1_path = _get_existing_path("sa1")
         self.asgs_sa2_path = _get_existing_path("sa2")
@@ -120,37 +115,33 @@ class Settings:
         self.asgs_iare_path = _get_existing_path("iare")
 
 
-# Global settings instance
-_settings = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the global settings instance."""
-    global _settings
-    if _settings is None:
-        try:
-            from dotenv import load_dotenv
+    """Get the global settings instance (built once, then cached)."""
+    try:
+        from dotenv import load_dotenv
 
-            load_dotenv()
-        except ImportError:
-            pass  # dotenv is optional
+        load_dotenv()
+    except ImportError:
+        pass  # dotenv is optional
 
-        _settings = Settings.from_env()
+    settings = Settings.from_env()
 
-        # Set default ASGS paths if not configured
-        asgs_dir = _settings.data_dir / "asgs"
-        if asgs_dir.exists() and not any(_settings.get_asgs_paths().values()):
-            _settings.set_default_asgs_paths(asgs_dir)
+    # Set default ASGS paths if not configured
+    asgs_dir = settings.data_dir / "asgs"
+    if asgs_dir.exists() and not any(settings.get_asgs_paths().values()):
+        settings.set_default_asgs_paths(asgs_dir)
 
-    return _settings
+    return settings
 
 
 def update_settings(**kwargs) -> None:
-    """Update global settings (mainly for testing)."""
-    global _settings
-    if _settings is None:
-        _settings = get_settings()
+    """Update global settings (mainly for testing).
 
+    Mutates the cached instance in place, so callers holding a reference from
+    get_settings() observe the updates.
+    """
+    settings = get_settings()
     for key, value in kwargs.items():
-        if hasattr(_settings, key):
-            setattr(_settings, key, value)
+        if hasattr(settings, key):
+            setattr(settings, key, value)
@@ -4,6 +4,7 @@ from unittest.mock import Mock, patch
 import geopandas as gpd
 import pandas as pd
 import pytest
+from pyproj import Transformer
 from shapely.geometry import Polygon
 
 from src.classify import classify_points, get_classification_summary, load_layer
@@ -205,7 +206,10 @@ class TestClassifyPoints:
         # Create test point
         df = pd.DataFrame({"CHC": ["Location 1"], "Latitude": [-12.0], "Longitude": [131.0]})
 
-        # Mock boundary layer in different CRS with hierarchical data
+        # Boundary layer in a projected CRS: a box around the test point's
+        # EPSG:3577 (Australian Albers) coordinates
+        transformer = Transformer.from_crs("EPSG:4326", "EPSG:3577", always_xy=True)
+        x, y = transformer.transform(131.0, -12.0)
         sa1_boundary = gpd.GeoDataFrame(
             {
                 "SA1_CODE": ["123456"],
@@ -220,25 +224,31 @@ class TestClassifyPoints:
                 "STE_CODE": ["NT"],
                 "STE_NAME": ["Northern Territory"],
                 "geometry": [
-                    Polygon([(130.5, -12.5), (131.5, -12.5), (131.5, -11.5), (130.5, -11.5)])
+                    Polygon(
+                        [
+                            (x - 10000, y - 10000),
+                            (x + 10000, y - 10000),
+                            (x + 10000, y + 10000),
+                            (x - 10000, y + 10000),
+                        ]
+                    )
                 ],
             },
             crs="EPSG:3577",
         )  # Different CRS
 
-        # Mock to_crs to return the same data but with EPSG:4326
-        sa1_boundary_reprojected = sa1_boundary.copy()
-        sa1_boundary_reprojected.crs = "EPSG:4326"
-        sa1_boundary.to_crs = Mock(return_value=sa1_boundary_reprojected)
+        # Track boundary reprojection - it should never happen
+        sa1_boundary.to_crs = Mock(wraps=sa1_boundary.to_crs)
 
         mock_load_layer.return_value = sa1_boundary
 
         # Test classification
-        classify_points(df)
+        result = classify_points(df)
 
-        # Should have attempted CRS reprojection (may be called twice due to IARE processing)
-        assert sa1_boundary.to_crs.call_count >= 1
-        sa1_boundary.to_crs.assert_called_with("EPSG:4326")
+        # The points were reprojected to match the boundary, not the reverse,
+        # so the point still lands in its SA1
+        sa1_boundary.to_crs.assert_not_called()
+        assert result.iloc[0]["SA1"] == "123456"
 
     @patch("src.classify.load_layer")
     @patch("src.classify.get_settings")
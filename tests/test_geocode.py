@@ -78,9 +78,11 @@ class TestGeocodeName:
         assert result["address"] == "Adelaide River, Northern Territory, Australia"
         assert result["source"] == "nominatim"
 
-        # Verify geocoder was called with normalized name
+        # Verify geocoder was called with the structured query built from
+        # the normalized name
         mock_rate_limited_geocode.assert_called_with(
-            "Adelaide River, NT, Australia", country_codes="au"
+            {"city": "Adelaide River", "state": "NT", "country": "Australia"},
+            country_codes="au",
         )
 
     @patch("src.geocode.get_settings")
@@ -0,0 +1,105 @@
+import sqlite3
+import time
+
+import pytest
+
+from src.geocode_cache import (
+    NEGATIVE_TTL_SEC,
+    POSITIVE_TTL_SEC,
+    GeocodeCache,
+)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "geocode_cache.sqlite"
+
+
+def _backdate(path, seconds):
+    """Shift every row's timestamp into the past."""
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "UPDATE geocode_cache SET ts = ?", (int(time.time()) - seconds,)
+        )
+
+
+class TestGeocodeCache:
+    """Test the SQLite geocode cache."""
+
+    def test_get_returns_none_on_miss(self, cache_path):
+        """Test that an unknown key is a miss."""
+        cache = GeocodeCache(cache_path)
+
+        assert cache.get("never seen") is None
+
+    def test_set_then_get_round_trip(self, cache_path):
+        """Test that a stored result is returned intact."""
+        cache = GeocodeCache(cache_path)
+        cache.set("adelaide river", -13.24, 131.11, "Adelaide River NT")
+
+        result = cache.get("adelaide river")
+
+        assert result == {"lat": -13.24, "lon": 131.11, "address": "Adelaide River NT"}
+
+    def test_persists_across_instances(self, cache_path):
+        """Test that entries survive the process (new instance, same file)."""
+        GeocodeCache(cache_path).set("batchelor", -13.05, 131.03, "Batchelor NT")
+
+        result = GeocodeCache(cache_path).get("batchelor")
+
+        assert result == {"lat": -13.05, "lon": 131.03, "address": "Batchelor NT"}
+
+    def test_set_miss_is_negative_hit(self, cache_path):
+        """Test that a negative-cached name returns a dict with null coordinates."""
+        cache = GeocodeCache(cache_path)
+        cache.set_miss("no such place")
+
+        result = cache.get("no such place")
+
+        assert result == {"lat": None, "lon": None, "address": None}
+
+    def test_expired_positive_entry_is_a_miss(self, cache_path):
+        """Test that positive entries expire after POSITIVE_TTL_SEC."""
+        GeocodeCache(cache_path).set("old town", -12.0, 131.0, "Old Town NT")
+        _backdate(cache_path, POSITIVE_TTL_SEC + 1)
+
+        # Fresh instance so the in-memory memo doesn't mask the disk TTL
+        assert GeocodeCache(cache_path).get("old town") is None
+
+    def test_expired_negative_entry_is_a_miss(self, cache_path):
+        """Test that negative entries expire after the shorter NEGATIVE_TTL_SEC."""
+        GeocodeCache(cache_path).set_miss("maybe mapped now")
+        _backdate(cache_path, NEGATIVE_TTL_SEC + 1)
+
+        assert GeocodeCache(cache_path).get("maybe mapped now") is None
+
+    def test_negative_ttl_shorter_than_positive(self, cache_path):
+        """Test that an age past the negative TTL only expires the miss entry."""
+        cache = GeocodeCache(cache_path)
+        cache.set("resolved", -12.0, 131.0, "Resolved NT")
+        cache.set_miss("unresolved")
+        _backdate(cache_path, NEGATIVE_TTL_SEC + 1)
+
+        fresh = GeocodeCache(cache_path)
+        assert fresh.get("resolved") is not None
+        assert fresh.get("unresolved") is None
+
+    def test_migrates_pre_ttl_database(self, cache_path):
+        """Test in-place migration of a database created before the ts column."""
+        with sqlite3.connect(cache_path) as conn:
+            conn.execute(
+                "CREATE TABLE geocode_cache "
+                "(key TEXT PRIMARY KEY, lat REAL, lon REAL, address TEXT)"
+            )
+            conn.execute(
+                "INSERT INTO geocode_cache VALUES (?, ?, ?, ?)",
+                ("legacy", -12.46, 130.84, "Darwin NT"),
+            )
+
+        cache = GeocodeCache(cache_path)
+
+        # Rows without a timestamp are treated as freshly written
+        assert cache.get("legacy") == {"lat": -12.46, "lon": 130.84, "address": "Darwin NT"}
+        with sqlite3.connect(cache_path) as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(geocode_cache)")}
+        assert "ts" in columns
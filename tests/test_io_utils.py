@@ -1,4 +1,4 @@
-import os
+import io
 import tempfile
 from pathlib import Path
 
@@ -24,56 +24,33 @@ class TestReadLocationsCsv:
 
     def test_read_locations_csv_success(self):
         """Test successful CSV reading."""
-        # Create temporary CSV file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            f.write("CHC,Extra_Column\n")
-            f.write("Location 1 CHC,Value 1\n")
-            f.write("Location 2 CHC,Value 2\n")
-            temp_path = Path(f.name)
-
-        try:
-            df = read_locations_csv(temp_path, required_columns=["CHC"])
-
-            assert len(df) == 2
-            assert list(df.columns) == ["CHC", "Extra_Column"]
-            assert df.iloc[0]["CHC"] == "Location 1 CHC"
-            assert df.iloc[1]["CHC"] == "Location 2 CHC"
-        finally:
-            os.unlink(temp_path)
+        # In-memory buffer: no tempfile create/unlink syscalls per test
+        buf = io.StringIO("CHC,Extra_Column\nLocation 1 CHC,Value 1\nLocation 2 CHC,Value 2\n")
+
+        df = read_locations_csv(buf, required_columns=["CHC"])
+
+        assert len(df) == 2
+        assert list(df.columns) == ["CHC", "Extra_Column"]
+        assert df.iloc[0]["CHC"] == "Location 1 CHC"
+        assert df.iloc[1]["CHC"] == "Location 2 CHC"
 
     def test_read_locations_csv_missing_required_column(self):
         """Test reading CSV with missing required columns."""
-        # Create temporary CSV file without CHC column
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            f.write("Location,Extra_Column\n")
-            f.write("Location 1,Value 1\n")
-            temp_path = Path(f.name)
-
-        try:
-            with pytest.raises(ValueError, match="Missing required columns: \\['CHC'\\]"):
-                read_locations_csv(temp_path, required_columns=["CHC"])
-        finally:
-            os.unlink(temp_path)
+        buf = io.StringIO("Location,Extra_Column\nLocation 1,Value 1\n")
+
+        with pytest.raises(ValueError, match="Missing required columns: \\['CHC'\\]"):
+            read_locations_csv(buf, required_columns=["CHC"])
 
     def test_read_locations_csv_remove_empty_rows(self):
         """Test that empty location names are removed."""
-        # Create temporary CSV file with empty values
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            f.write("CHC\n")
-            f.write("Location 1 CHC\n")
-            f.write("\n")  # Empty row
-            f.write("   \n")  # Whitespace only
-            f.write("Location 2 CHC\n")
-            temp_path = Path(f.name)
-
-        try:
-            df = read_locations_csv(temp_path, required_columns=["CHC"])
-
-            assert len(df) == 2
-            assert df.iloc[0]["CHC"] == "Location 1 CHC"
-            assert df.iloc[1]["CHC"] == "Location 2 CHC"
-        finally:
-            os.unlink(temp_path)
+        # Includes an empty row and a whitespace-only row
+        buf = io.StringIO("CHC\nLocation 1 CHC\n\n   \nLocation 2 CHC\n")
+
+        df = read_locations_csv(buf, required_columns=["CHC"])
+
+        assert len(df) == 2
+        assert df.iloc[0]["CHC"] == "Location 1 CHC"
+        assert df.iloc[1]["CHC"] == "Location 2 CHC"
 
 
 class TestWriteOutputCsv: